@@ -78,7 +78,7 @@ class GroupSelection:
         if dev is None:  # --prod is not set, include dev-dependencies
             dev = True
         project = self.project
-        optional_groups = set(project.pyproject.metadata.get("optional-dependencies", {}))
+        optional_groups = set(project.pyproject.metadata_view.get("optional-dependencies", {}))
         dev_groups = set(project.pyproject.dev_dependencies)
         groups_set = set(groups)
         if groups_set & dev_groups:
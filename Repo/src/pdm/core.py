@@ -217,7 +217,7 @@ class Core:
         if project.is_global:
             return args
         try:
-            config = project.pyproject.settings.get("options", {})
+            config = project.pyproject.settings_view.get("options", {})
         except tomlkit.exceptions.TOMLKitError as e:  # pragma: no cover
             self.ui.error(f"Failed to parse pyproject.toml: {e}")
             config = {}
@@ -148,7 +148,7 @@ class BaseEnvironment(abc.ABC):
             no_binary=self._setting_list("PDM_NO_BINARY", "resolution.no-binary"),
             only_binary=self._setting_list("PDM_ONLY_BINARY", "resolution.only-binary"),
             prefer_binary=self._setting_list("PDM_PREFER_BINARY", "resolution.prefer-binary"),
-            respect_source_order=self.project.pyproject.settings.get("resolution", {}).get(
+            respect_source_order=self.project.pyproject.settings_view.get("resolution", {}).get(
                 "respect-source-order", False
             ),
             verbosity=self.project.core.ui.verbosity,
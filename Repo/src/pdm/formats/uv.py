@@ -88,7 +88,7 @@ class _UvFileBuilder:
             ]
             packages.append(self._build_lock_entry(related_packages))
         if name := self.project.name:
-            version = self.project.pyproject.metadata.get("version", "0.0.0")
+            version = self.project.pyproject.metadata_view.get("version", "0.0.0")
             this_package = {
                 "name": normalize_name(name),
                 "version": version,
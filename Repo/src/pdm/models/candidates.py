@@ -530,10 +530,11 @@ class PreparedCandidate:
 
         try:
             pyproject = PyProject(pyproject_toml, ui=self.environment.project.core.ui)
+            # flit and poetry metadata is converted when the document is loaded here
+            metadata = pyproject.metadata.unwrap()
         except MetaConvertError as e:
             termui.logger.warning("Failed to parse pyproject.toml: %s", e)
             return None
-        metadata = pyproject.metadata.unwrap()
         if not metadata:
             termui.logger.warning("Failed to parse pyproject.toml")
             return None
@@ -144,7 +144,7 @@ class BaseRepository:
         return candidate
 
     def _should_ignore_package_warning(self, requirement: Requirement) -> bool:
-        ignore_settings: list[str] = self.environment.project.pyproject.settings.get("ignore_package_warnings", [])
+        ignore_settings: list[str] = self.environment.project.pyproject.settings_view.get("ignore_package_warnings", [])
         package_name = requirement.key
         assert package_name is not None
         for pat in ignore_settings:
@@ -296,7 +296,7 @@ class BaseRepository:
         comes_from = candidate.link.comes_from if candidate.link else None
         result: list[FileHash] = []
         logged = False
-        respect_source_order = self.environment.project.pyproject.settings.get("resolution", {}).get(
+        respect_source_order = self.environment.project.pyproject.settings_view.get("resolution", {}).get(
             "respect-source-order", False
         )
         sources = self.get_filtered_sources(candidate.req)
@@ -219,7 +219,7 @@ class Project:
 
     @property
     def scripts(self) -> dict[str, str | dict[str, str]]:
-        return self.pyproject.settings.get("scripts", {})
+        return self.pyproject.settings_view.get("scripts", {})
 
     @cached_property
     def project_config(self) -> Config:
@@ -233,7 +233,7 @@ class Project:
 
     @property
     def name(self) -> str:
-        return self.pyproject.metadata.get("name")
+        return self.pyproject.metadata_view.get("name")
 
     @property
     def python(self) -> PythonInfo:
@@ -393,10 +393,10 @@ class Project:
 
     @property
     def python_requires(self) -> PySpecSet:
-        return PySpecSet(self.pyproject.metadata.get("requires-python", ""))
+        return PySpecSet(self.pyproject.metadata_view.get("requires-python", ""))
 
     def get_dependencies(self, group: str | None = None) -> Sequence[Requirement]:
-        metadata = self.pyproject.metadata
+        metadata = self.pyproject.metadata_view
         group = group or "default"
         optional_dependencies = metadata.get("optional-dependencies", {})
         dev_dependencies = self.pyproject.dev_dependencies
@@ -435,8 +435,8 @@ class Project:
 
     def iter_groups(self) -> Iterable[str]:
         groups = {"default"}
-        if self.pyproject.metadata.get("optional-dependencies"):
-            groups.update(self.pyproject.metadata["optional-dependencies"].keys())
+        if self.pyproject.metadata_view.get("optional-dependencies"):
+            groups.update(self.pyproject.metadata_view["optional-dependencies"].keys())
         groups.update(self.pyproject.dev_dependencies.keys())
         return groups
 
@@ -465,7 +465,7 @@ class Project:
 
     def get_sources(self, expand_env: bool = True, include_stored: bool = False) -> list[RepositoryConfig]:
         result: dict[str, RepositoryConfig] = {}
-        for source in self.pyproject.settings.get("source", []):
+        for source in self.pyproject.settings_view.get("source", []):
             result[source["name"]] = RepositoryConfig(**source, config_prefix="pypi")
 
         def merge_sources(other_sources: Iterable[RepositoryConfig]) -> None:
@@ -861,7 +861,7 @@ class Project:
     def is_distribution(self) -> bool:
         if not self.name:
             return False
-        settings = self.pyproject.settings
+        settings = self.pyproject.settings_view
         if "package-type" in settings:
             return settings["package-type"] == "library"
         elif "distribution" in settings:
@@ -876,7 +876,7 @@ class Project:
         Returns `None` if the key does not exists.
         """
         try:
-            return reduce(operator.getitem, key.split("."), self.pyproject.settings)
+            return reduce(operator.getitem, key.split("."), self.pyproject.settings_view)
         except KeyError:
             return None
 
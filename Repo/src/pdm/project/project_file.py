@@ -2,32 +2,131 @@ from __future__ import annotations
 
 import hashlib
 import json
+from pathlib import Path
 from typing import Any, Mapping
 
 from tomlkit import TOMLDocument, items
+from tomlkit.container import OutOfOrderTableProxy
 
 from pdm import termui
+from pdm.compat import tomllib
 from pdm.exceptions import ProjectError
 from pdm.project.toml_file import TOMLBase
 from pdm.utils import normalize_name
 
 
 def _remove_empty_tables(doc: dict) -> None:
-    for k, v in list(doc.items()):
-        if isinstance(v, dict):
-            _remove_empty_tables(v)
-            if not v:
-                del doc[k]
+    # Post-order traversal with an explicit stack, so that a table emptied
+    # by removing its children is removed as well.
+    stack: list[tuple[dict, str, dict, bool]] = [(doc, k, v, False) for k, v in doc.items() if isinstance(v, dict)]
+    while stack:
+        parent, key, table, visited = stack.pop()
+        if visited:
+            if not table:
+                del parent[key]
+            continue
+        stack.append((parent, key, table, True))
+        stack.extend((table, k, v, False) for k, v in table.items() if isinstance(v, dict))
+
+
+def _unwrap(value: Any) -> Any:
+    """Convert a tomlkit table or item into plain Python objects, other values are returned as is."""
+    return value.unwrap() if isinstance(value, (items.Item, OutOfOrderTableProxy)) else value
+
+
+def _copy(value: Any) -> Any:
+    """Copy the tables and arrays of plain TOML data recursively."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
 
 
 class PyProject(TOMLBase):
     """The data object representing th pyproject.toml file"""
 
-    def read(self) -> TOMLDocument:
-        from pdm.formats import flit, poetry
+    def __init__(self, path: str | Path, *, ui: termui.UI) -> None:
+        self._hash_input: bytes | None = None
+        self._hash_cache: dict[str, str] = {}
+        self._hash_content: bytes | None = None
+        self._dev_dependencies: dict[str, list[Any]] | None = None
+        self._document: TOMLDocument | None = None
+        self._query_data: dict[str, Any] | None = None
+        # The tables created by the accessors rather than read from the file
+        self._created_tables: set[tuple[str, ...]] = set()
+        super().__init__(path, ui=ui)
+
+    @property
+    def _data(self) -> TOMLDocument:
+        """The style-preserving document, which is only parsed when first requested."""
+        if self._document is None:
+            self._document = self.read()
+            # The document may be modified from now on, stop using the plain data.
+            self._query_data = None
+            self._created_tables.clear()
+            self._clear_cache()
+        return self._document
+
+    @_data.setter
+    def _data(self, value: TOMLDocument) -> None:
+        self._document = value
+        self._query_data = None
+        self._created_tables.clear()
+        self._clear_cache()
+
+    def _query(self) -> Mapping[str, Any]:
+        """Get the document for read-only access. It is parsed by tomllib
+        unless the TOMLDocument has been loaded already.
+        """
+        if self._document is not None:
+            return self._document
+        if self._query_data is None:
+            try:
+                data = self.read_for_query()
+            except tomllib.TOMLDecodeError:
+                # Let tomlkit report the error
+                return self._data
+            if "project" not in data and self._path.exists():
+                # The metadata may be converted from flit or poetry in read()
+                return self._data
+            self._query_data = data
+        return self._query_data
 
+    def _table(self, *keys: str) -> Mapping[str, Any]:
+        """Get a table for read-only access without copying it, the result must not be
+        handed out since the tomllib data may back the cached values.
+        """
+        table = self._query()
+        for key in keys:
+            table = table.get(key, {})
+        return table
+
+    def _view(self, value: Any) -> Any:
+        """Prepare a value read by `_query()` to be handed out. Values from the tomllib
+        data are copied so that changes by the caller can't reach it.
+        """
+        return _copy(value) if self._cacheable else value
+
+    @property
+    def _cacheable(self) -> bool:
+        """Computed values are only cached while the document is served from the
+        tomllib data. It is never modified since the accessors only hand out copies
+        of it, while the TOMLDocument can be changed in place at any time through
+        the tables returned by metadata, settings and dependency_groups.
+        """
+        return self._document is None
+
+    def _clear_cache(self) -> None:
+        """Drop the values computed from the tomllib data."""
+        self._hash_content = None
+        self._dev_dependencies = None
+
+    def read(self) -> TOMLDocument:
         data = super().read()
         if "project" not in data and self._path.exists():
+            from pdm.formats import flit, poetry
+
             # Try converting from flit and poetry
             for converter in (flit, poetry):
                 if converter.check_fingerprint(None, self._path):
@@ -42,73 +141,151 @@ class PyProject(TOMLBase):
         """Write the TOMLDocument to the file."""
         _remove_empty_tables(self._data.get("project", {}))
         _remove_empty_tables(self._data.get("tool", {}).get("pdm", {}))
-        if "dependency-groups" in self._data and not self.dependency_groups:
+        if "dependency-groups" in self._data and not self._data["dependency-groups"]:
             del self._data["dependency-groups"]
+        # The accessors create the tables on read, don't write them if they are still empty.
+        # Deeper tables go first so that a parent emptied by removing them is dropped as well.
+        for keys in sorted(self._created_tables, key=len, reverse=True):
+            parent: Any = self._data
+            for key in keys[:-1]:
+                parent = parent.get(key, {})
+            if keys[-1] in parent and not parent[keys[-1]]:
+                del parent[keys[-1]]
+        self._created_tables.clear()
         super().write()
         if show_message:
             self.ui.echo("Changes are written to [success]pyproject.toml[/].", verbosity=termui.Verbosity.NORMAL)
 
+    def reload(self) -> None:
+        self._document = None
+        self._query_data = None
+        self._created_tables.clear()
+        self._clear_cache()
+
     @property
     def is_valid(self) -> bool:
-        return bool(self._data.get("project"))
+        return bool(self._query().get("project"))
+
+    def _setdefault_table(self, *keys: str) -> items.Table:
+        """Get the table by its keys, creating the missing ones."""
+        table: Any = self._data
+        for i, key in enumerate(keys):
+            if key not in table:
+                self._created_tables.add(keys[: i + 1])
+            table = table.setdefault(key, {})
+        return table
 
     @property
     def metadata(self) -> items.Table:
-        return self._data.setdefault("project", {})
+        return self._setdefault_table("project")
+
+    @property
+    def metadata_view(self) -> Mapping[str, Any]:
+        """The `[project]` table for read-only access. Unlike `metadata`, it doesn't
+        load the TOMLDocument or create the table if it is missing.
+        """
+        return self._view(self._table("project"))
 
     @property
     def dependency_groups(self) -> items.Table:
-        return self._data.setdefault("dependency-groups", {})
+        return self._setdefault_table("dependency-groups")
 
     @property
     def dev_dependencies(self) -> dict[str, list[Any]]:
+        """All dependency groups from both `[dependency-groups]` and the legacy
+        `[tool.pdm.dev-dependencies]` tables, keyed by normalized group names.
+        """
+        return self._view(self._get_dev_dependencies())
+
+    def _get_dev_dependencies(self) -> dict[str, list[Any]]:
+        if self._dev_dependencies is not None:
+            return self._dev_dependencies
         groups: dict[str, list[Any]] = {}
-        for group, deps in self._data.get("dependency-groups", {}).items():
+        # Unwrap the whole tables in one go instead of each group
+        dependency_groups = _unwrap(self._table("dependency-groups"))
+        legacy_dev_dependencies = _unwrap(self._table("tool", "pdm", "dev-dependencies"))
+        for group, deps in dependency_groups.items():
             group = normalize_name(group)
             if group in groups:
                 raise ProjectError(f"The group {group} is duplicated in dependency-groups")
-            groups[group] = deps.unwrap() if hasattr(deps, "unwrap") else deps
-        for group, deps in self.settings.get("dev-dependencies", {}).items():
+            groups[group] = list(deps)
+        for group, deps in legacy_dev_dependencies.items():
             group = normalize_name(group)
-            groups.setdefault(group, []).extend(deps.unwrap() if hasattr(deps, "unwrap") else deps)
+            if group in groups:
+                groups[group].extend(deps)
+            else:
+                groups[group] = list(deps)
+        if self._cacheable:
+            self._dev_dependencies = groups
         return groups
 
     @property
     def settings(self) -> items.Table:
-        return self._data.setdefault("tool", {}).setdefault("pdm", {})
+        return self._setdefault_table("tool", "pdm")
+
+    @property
+    def settings_view(self) -> Mapping[str, Any]:
+        """The `[tool.pdm]` table for read-only access. Unlike `settings`, it doesn't
+        load the TOMLDocument or create the table if it is missing.
+        """
+        return self._view(self._table("tool", "pdm"))
 
     @property
     def build_system(self) -> dict:
-        return self._data.get("build-system", {})
+        return self._view(self._table("build-system"))
 
     @property
     def resolution(self) -> Mapping[str, Any]:
         """A compatible getter method for the resolution overrides
         in the pyproject.toml file.
         """
-        return self.settings.get("resolution", {})
+        return self._view(self._table("tool", "pdm", "resolution"))
 
     @property
     def allow_prereleases(self) -> bool | None:
-        return self.resolution.get("allow-prereleases")
+        return self._table("tool", "pdm", "resolution").get("allow-prereleases")
+
+    def _get_hash_content(self) -> bytes:
+        """Get the canonical form of the content that affects locking, it is cached
+        while the document is served from the tomllib data.
+        """
+        if self._hash_content is not None:
+            return self._hash_content
+        data = self._query()
+        metadata = self._table("project")
+        settings = self._table("tool", "pdm")
+        # Many projects have no dependency groups, skip building the merged mapping for them
+        has_groups = "dependency-groups" in data or "dev-dependencies" in settings
+        dump_data = {
+            "sources": settings.get("source", []),
+            "dependencies": metadata.get("dependencies", []),
+            "dev-dependencies": self._get_dev_dependencies() if has_groups else {},
+            "optional-dependencies": metadata.get("optional-dependencies", {}),
+            "requires-python": metadata.get("requires-python", ""),
+            "resolution": settings.get("resolution", {}),
+        }
+        content = json.dumps(dump_data, sort_keys=True).encode("utf-8")
+        if self._cacheable:
+            self._hash_content = content
+        return content
 
     def content_hash(self, algo: str = "sha256") -> str:
         """Generate a hash of the sensible content of the pyproject.toml file.
         When the hash changes, it means the project needs to be relocked.
         """
-        dump_data = {
-            "sources": self.settings.get("source", []),
-            "dependencies": self.metadata.get("dependencies", []),
-            "dev-dependencies": self.dev_dependencies,
-            "optional-dependencies": self.metadata.get("optional-dependencies", {}),
-            "requires-python": self.metadata.get("requires-python", ""),
-            "resolution": self.resolution,
-        }
-        pyproject_content = json.dumps(dump_data, sort_keys=True)
-        hasher = hashlib.new(algo)
-        hasher.update(pyproject_content.encode("utf-8"))
-        return hasher.hexdigest()
+        pyproject_content = self._get_hash_content()
+        # The tables can be changed in place by anyone holding them, so the digests
+        # are kept for the content they were computed from rather than invalidated.
+        if pyproject_content != self._hash_input:
+            self._hash_input = pyproject_content
+            self._hash_cache.clear()
+        if algo not in self._hash_cache:
+            # sha256 is what lock files record, skip the lookup by name for it
+            hasher = hashlib.sha256() if algo == "sha256" else hashlib.new(algo)
+            hasher.update(pyproject_content)
+            self._hash_cache[algo] = hasher.hexdigest()
+        return self._hash_cache[algo]
 
     @property
     def plugins(self) -> list[str]:
-        return self.settings.get("plugins", [])
+        return self._view(self._table("tool", "pdm").get("plugins", []))
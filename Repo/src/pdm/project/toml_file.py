@@ -8,20 +8,32 @@ from tomlkit.toml_document import TOMLDocument
 from tomlkit.toml_file import TOMLFile
 
 from pdm import termui
+from pdm.compat import tomllib
 
 
 class TOMLBase(TOMLFile):
+    _path: Path
+
     def __init__(self, path: str | Path, *, ui: termui.UI) -> None:
         super().__init__(path)
         self._path = Path(path)
         self.ui = ui
-        self._data = self.read()
+        self.reload()
 
     def read(self) -> TOMLDocument:
         if not self._path.exists():
             return tomlkit.document()
         return super().read()
 
+    def read_for_query(self) -> dict[str, Any]:
+        """Read the file into plain Python objects, which is much faster than
+        building a TOMLDocument but loses the style information needed for writing.
+        """
+        if not self._path.exists():
+            return {}
+        with self._path.open("rb") as fp:
+            return tomllib.load(fp)
+
     def set_data(self, data: Mapping[str, Any]) -> None:
         """Set the data of the TOML file."""
         self._data = tomlkit.document()
@@ -59,7 +59,7 @@ class UvResolver(Resolver):
                 first_index = False
             else:
                 cmd.extend(["--extra-index-url", source.url])
-        if self.project.pyproject.settings.get("resolution", {}).get("respect-source-order", False):
+        if self.project.pyproject.settings_view.get("resolution", {}).get("respect-source-order", False):
             cmd.append("--index-strategy=unsafe-first-match")
         else:
             cmd.append("--index-strategy=unsafe-best-match")
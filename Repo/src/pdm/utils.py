@@ -342,7 +342,7 @@ def get_rev_from_url(url: str) -> str:
     return ""
 
 
-@functools.lru_cache
+@functools.lru_cache(None)
 def normalize_name(name: str, lowercase: bool = True) -> str:
     name = re.sub(r"[^A-Za-z0-9]+", "-", name)
     return name.lower() if lowercase else name
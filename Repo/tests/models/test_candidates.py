@@ -169,6 +169,15 @@ def test_parse_poetry_project_metadata(project, is_editable):
     assert candidate.version == "0.1.0"
 
 
+def test_parse_poetry_project_metadata_convert_error(project, mocker):
+    from pdm.formats import MetaConvertError, poetry
+
+    mocker.patch.object(poetry, "convert", side_effect=MetaConvertError(["error"], data={}, settings={}))
+    project_root = FIXTURES / "projects/poetry-demo"
+    candidate = Candidate(parse_requirement(project_root.as_posix())).prepare(project.environment)
+    assert candidate._get_metadata_from_project(project_root / "pyproject.toml") is None
+
+
 @pytest.mark.usefixtures("local_finder")
 def test_parse_flit_project_metadata(project, is_editable):
     req = parse_requirement(f"{(FIXTURES / 'projects/flit-demo').as_posix()}", is_editable)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import sys
 import venv
@@ -550,3 +552,141 @@ def test_project_best_match_min(project, mocker):
         return_value=get_python_versions(),
     )
     assert project.get_best_matching_cpython_version(use_minimum=True) == expected
+
+
+def test_content_hash_refreshed_after_modification(project):
+    old_hash = project.pyproject.content_hash()
+    assert project.pyproject.content_hash() == old_hash
+    project.pyproject.metadata["requires-python"] = ">=3.9"
+    assert project.pyproject.content_hash() != old_hash
+    new_hash = project.pyproject.content_hash()
+    project.pyproject.reload()
+    assert project.pyproject.content_hash() == old_hash
+    project.pyproject.settings["resolution"] = {"allow-prereleases": True}
+    assert project.pyproject.content_hash() not in (old_hash, new_hash)
+
+
+def test_content_hash_follows_changes_to_kept_tables(project):
+    metadata = project.pyproject.metadata
+    old_hash = project.pyproject.content_hash()
+    metadata["requires-python"] = ">=3.12"
+    assert project.pyproject.content_hash() != old_hash
+
+
+def test_read_only_access_skips_tomlkit_document(project):
+    project.pyproject.metadata["dependencies"] = ["requests"]
+    project.pyproject.dependency_groups["test"] = ["pytest"]
+    project.pyproject.settings["dev-dependencies"] = {"test": ["pytest-cov"]}
+    project.pyproject.settings["options"] = {"add": ["--no-isolation"]}
+    project.pyproject.settings["scripts"] = {"hello": "echo hello"}
+    project.pyproject.write()
+    expected_hash = project.pyproject.content_hash()
+
+    project.pyproject.reload()
+    assert project.pyproject.is_valid
+    assert project.pyproject.dev_dependencies == {"test": ["pytest", "pytest-cov"]}
+    assert project.pyproject.content_hash() == expected_hash
+    assert project.name == "test-project"
+    assert project.scripts == {"hello": "echo hello"}
+    assert project.get_setting("options.add") == ["--no-isolation"]
+    assert project.core._get_cli_args(["add", "requests"], project) == ["add", "--no-isolation", "requests"]
+    assert project.pyproject._document is None
+    assert project.pyproject.metadata["dependencies"] == ["requests"]
+    assert project.pyproject._document is not None
+
+
+def test_read_only_views_are_copies_of_tomllib_data(project):
+    project.pyproject.dependency_groups["test"] = ["pytest", {"include-group": "lint"}]
+    project.pyproject.dependency_groups["lint"] = ["ruff"]
+    project.pyproject.settings["resolution"] = {"allow-prereleases": True}
+    project.pyproject.settings["scripts"] = {"hello": {"cmd": ["echo", "hello"]}}
+    project.pyproject.write()
+    project.pyproject.reload()
+    content_hash = project.pyproject.content_hash()
+
+    project.pyproject.resolution["allow-prereleases"] = False  # type: ignore[index]
+    project.pyproject.settings_view["scripts"]["hello"]["cmd"].append("world")
+    project.pyproject.metadata_view["name"] = "other"  # type: ignore[index]
+    project.pyproject.dev_dependencies["test"][1]["include-group"] = "other"
+    assert project.pyproject.allow_prereleases is True
+    assert project.pyproject.content_hash() == content_hash
+    assert project.scripts == {"hello": {"cmd": ["echo", "hello"]}}
+    assert project.name == "test-project"
+    assert project.pyproject._document is None
+    # Once the TOMLDocument is loaded, the accessors hand out its tables to be modified
+    assert project.pyproject.metadata["name"] == "test-project"
+    project.pyproject.resolution["allow-prereleases"] = False  # type: ignore[index]
+    assert project.pyproject.content_hash() != content_hash
+
+
+def test_dev_dependencies_cache_invalidated_on_change(project):
+    project.pyproject.dependency_groups["test"] = ["pytest"]
+    project.pyproject.write()
+    project.pyproject.reload()
+    content_hash = project.pyproject.content_hash()
+    dev_dependencies = project.pyproject.dev_dependencies
+    dev_dependencies["test"].append("evil")
+    dev_dependencies["doc"] = ["mkdocs"]
+    assert project.pyproject.dev_dependencies == {"test": ["pytest"]}
+    assert project.pyproject.content_hash() == content_hash
+    dependency_groups = project.pyproject.dependency_groups
+    assert project.pyproject.dev_dependencies == {"test": ["pytest"]}
+    dependency_groups["doc"] = ["mkdocs"]
+    assert project.pyproject.dev_dependencies == {"test": ["pytest"], "doc": ["mkdocs"]}
+
+
+def test_content_hash_of_canonical_json(project):
+    project.pyproject.metadata["dependencies"] = ["requests>=2"]
+    project.pyproject.metadata["requires-python"] = ">=3.8"
+    project.pyproject.dependency_groups["Test"] = ["pytest", {"include-group": "doc"}]
+    project.pyproject.dependency_groups["doc"] = ["mkdocs"]
+    project.pyproject.settings["resolution"] = {"allow-prereleases": True}
+    dump_data = {
+        "sources": [],
+        "dependencies": ["requests>=2"],
+        "dev-dependencies": {"test": ["pytest", {"include-group": "doc"}], "doc": ["mkdocs"]},
+        "optional-dependencies": {},
+        "requires-python": ">=3.8",
+        "resolution": {"allow-prereleases": True},
+    }
+    expected = hashlib.sha256(json.dumps(dump_data, sort_keys=True).encode("utf-8")).hexdigest()
+    assert project.pyproject.content_hash() == expected
+    project.pyproject.write()
+    project.pyproject.reload()
+    assert project.pyproject.content_hash() == expected
+
+
+def test_reading_missing_tables_does_not_change_file(project_no_init):
+    pyproject_file = project_no_init.root / "pyproject.toml"
+    content = '[project]\nname = "foo"\nversion = "0.1.0"\n\n[tool.black]\nline-length = 100\n'
+    pyproject_file.write_text(content)
+    project_no_init.pyproject.reload()
+    assert not project_no_init.pyproject.settings.get("source")
+    assert not project_no_init.pyproject.dependency_groups.get("test")
+    assert not project_no_init.pyproject.metadata.get("optional-dependencies")
+    project_no_init.pyproject.write()
+    assert pyproject_file.read_text() == content
+
+
+def test_write_keeps_empty_tables_from_file(project_no_init):
+    pyproject_file = project_no_init.root / "pyproject.toml"
+    content = '[project]\nname = "foo"\nversion = "0.1.0"\n\n[tool.pdm]\n'
+    pyproject_file.write_text(content)
+    project_no_init.pyproject.reload()
+    assert not project_no_init.pyproject.settings.get("source")
+    project_no_init.pyproject.write()
+    assert pyproject_file.read_text() == content
+
+
+def test_remove_empty_tables():
+    from pdm.project.project_file import _remove_empty_tables
+
+    doc = {
+        "name": "foo",
+        "empty": {},
+        "nested": {"a": {"b": {}, "c": {"d": {}}}},
+        "kept": {"a": {"b": {}}, "value": 1},
+        "list": [],
+    }
+    _remove_empty_tables(doc)
+    assert doc == {"name": "foo", "kept": {"value": 1}, "list": []}